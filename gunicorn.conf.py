@@ -0,0 +1,14 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration for serving server:app.
+# Run with: gunicorn -c gunicorn.conf.py server:app
+
+bind = f"0.0.0.0:{os.getenv('PORT', '7078')}"
+
+# Worker processes for parallelism across cores; each one handles requests on
+# a pool of threads, which suits the blocking upstream I/O in /picture.
+# Note that the image cache is in-memory and therefore per worker process.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+worker_class = "gthread"
@@ -2,15 +2,42 @@ from dotenv import load_dotenv
 import os
 import threading
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 from flask import Flask, request, jsonify, Response
-from typing import Dict, Tuple, FrozenSet, Any
+from flask.json.provider import JSONProvider
+from typing import Tuple, Iterator, Mapping, Callable
 import logging
+import hashlib
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import functools
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster ``jsonify`` responses."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Hand orjson's bytes straight to the response instead of going through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
 # Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,49 +46,126 @@ logger = logging.getLogger(__name__)
 # Global cache toggle
 ENABLE_CACHE = os.getenv("ENABLE_CACHE", "").lower() in {"1", "true", "yes"}
 
-# Global cache + lock
-cache_lock = threading.Lock()
-photo_cache: Dict[Tuple[str, FrozenSet[Tuple[str, Any]]], Tuple[bytes, str]] = {}
+# How long browsers and intermediaries may reuse a cached image, in seconds
+CACHE_CONTROL_MAX_AGE = int(os.getenv("CACHE_CONTROL_MAX_AGE", "3600"))
+
+# Maximum number of images kept in the cache before least-recently-used eviction
+CACHE_MAX_ENTRIES = max(1, int(os.getenv("PHOTO_CACHE_MAX", "128")))
+
+# Global cache, split into independently locked shards so concurrent requests for
+# different keys don't contend on a single lock. Must be a power of two.
+CACHE_SHARDS = 16
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+# (photo_binary_data, photo_mime_type, etag)
+CacheEntry = Tuple[bytes | bytearray, str, str]
+_shards: list[Tuple[threading.Lock, OrderedDict[CacheKey, CacheEntry]]] = [
+    (threading.Lock(), OrderedDict()) for _ in range(CACHE_SHARDS)
+]
+
+# Total number of entries across all shards, so CACHE_MAX_ENTRIES caps the whole
+# cache. Only ever acquired while holding a shard lock, never the other way round.
+_cache_size = 0
+_cache_size_lock = threading.Lock()
+
+
+class _InflightFetch:
+    """An upstream fetch in progress that concurrent misses for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        # Set by the fetching thread on success; still None after ``done`` means it failed
+        self.entry: CacheEntry | None = None
+
+
+# Upstream fetches currently in progress, one dict per cache shard and each
+# guarded by that shard's lock. Concurrent misses for the same key wait on the
+# fetch instead of fetching the same photo again.
+_inflight_shards: list[dict[CacheKey, _InflightFetch]] = [{} for _ in range(CACHE_SHARDS)]
+# How often a waiting request logs that it is still waiting on an in-flight fetch
+INFLIGHT_WAIT_LOG_INTERVAL = 15
+
+
+def _shard_index(cache_key: CacheKey) -> int:
+    """Return the index of the shard responsible for a cache key."""
+    return hash(cache_key) & (CACHE_SHARDS - 1)
+
+
+def _get_shard(cache_key: CacheKey) -> tuple[threading.Lock, OrderedDict]:
+    """Return the (lock, cache) shard responsible for a cache key."""
+    return _shards[_shard_index(cache_key)]
+
+
+# Runs fire-and-forget side requests off the request path
+_background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+# Chunk size used when streaming image bodies straight through to the client
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Per-thread HTTP sessions: keep-alive connections are reused across requests
+# without worker threads contending on a shared connection pool
+_session_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's HTTP session, creating it on first use."""
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = 'image_randomizer/1.0'
+        session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
+        _session_local.session = session
+    return session
 
 
 def _get_provider_configs() -> dict[str, dict]:
+    """Build the provider configuration table.
+
+    Called once at import time (see ``_PROVIDER_CONFIGS``) rather than per request.
+    """
     return {
         'unsplash': {
             'api_url': 'https://api.unsplash.com/photos/random',
             'headers': {
                 'Authorization': f'Client-ID {os.getenv("UNSPLASH_ACCESS_KEY")}'
             },
-            'body_params': {
+            'body_params': MappingProxyType({
                 'orientation': 'landscape',
                 'width': 1920,
                 'height': 1080
-            },
-            'pre': _unsplash_pre,
+            }),
+            'pre': None,
             'post': _unsplash_post
         },
         'lorem_picsum': {
             'api_url': 'https://picsum.photos/1920/1080',
             'headers': {},
-            'body_params': {
+            'body_params': MappingProxyType({
                 'w': 1920,
                 'h': 1080
-            },
+            }),
             'pre': _lorem_picsum_pre,
-            'post': _lorem_picsum_post
+            'post': None
         }
     }
 
 
-def _build_request_params(provider_cfg: dict, overrides: dict) -> dict:
+def _build_request_params(provider_cfg: dict, overrides: Mapping[str, str]) -> Mapping:
     """Build request parameters for a provider, applying overrides and theme.
 
     Args:
         provider_cfg (dict): Provider-specific configuration dictionary.
-        overrides (dict): User-supplied query/body parameter overrides.
+        overrides (Mapping[str, str]): User-supplied query/body parameter overrides.
 
     Returns:
-        dict: Final merged request parameters for the API call.
+        Mapping: Final merged request parameters for the API call. Without
+            overrides this is the provider's read-only default params, not a copy.
     """
+    if not overrides:
+        return provider_cfg['body_params']
     params = provider_cfg['body_params'].copy()
     params.update(overrides)
     theme = overrides.get('theme')
@@ -90,22 +194,132 @@ def build_picsum_url(width: int = 1920, height: int = 1080,
     return url
 
 
+def _raise_for_status(resp: requests.Response):
+    """Raise for an error status, closing the streamed response first.
+
+    Error bodies of ``stream=True`` requests are never read, so closing them
+    here keeps the connection from being left checked out of the pool.
+    """
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+
+
+def _stream_body(resp: requests.Response) -> Iterator[bytes]:
+    """Yield a streamed response body in chunks, releasing the connection when done."""
+    try:
+        yield from resp.iter_content(STREAM_CHUNK_SIZE)
+    finally:
+        resp.close()
+
+
+def _read_body(resp: requests.Response) -> bytes | bytearray:
+    """Read a streamed response body into a single preallocated buffer.
+
+    ``resp.content`` collects the body as a list of chunks and then joins them,
+    briefly holding two copies of every image. When the size is known up front
+    the body is read into one ``bytearray`` instead, at most
+    ``STREAM_CHUNK_SIZE`` bytes per read: urllib3's ``readinto`` reads into a
+    temporary ``bytes`` of the requested size before copying, so an uncapped
+    read would allocate a second full-size copy anyway.
+    """
+    length = resp.headers.get("Content-Length")
+    if not length or not length.isdigit() or resp.headers.get("Content-Encoding"):
+        return resp.content
+
+    buf = bytearray(int(length))
+    view = memoryview(buf)
+    offset = 0
+    try:
+        while offset < len(buf):
+            n = resp.raw.readinto(view[offset:offset + STREAM_CHUNK_SIZE])
+            if not n:
+                break
+            offset += n
+    except urllib3.exceptions.HTTPError as e:
+        resp.close()
+        raise requests.ConnectionError(e) from e
+    finally:
+        view.release()
+
+    if offset < len(buf):
+        resp.close()
+        raise requests.RequestException(f"Incomplete image body: got {offset} of {len(buf)} bytes")
+    resp.raw.release_conn()
+    return buf
+
+
+def _response_body(resp: requests.Response, stream: bool) -> tuple[bytes | bytearray | Iterator[bytes], str]:
+    """Return (body, mime_type) for a streamed image response, either buffered or as chunks."""
+    mime_type = resp.headers.get("Content-Type", "image/jpeg")
+    if stream:
+        return _stream_body(resp), mime_type
+    return _read_body(resp), mime_type
+
+
 # ---- Unsplash ----
-def _unsplash_pre(url: str, params: dict) -> tuple[str, dict]:
-    """No-op for Unsplash pre-processing."""
-    return url, params
+def _track_unsplash_download(download_location: str):
+    """Notify Unsplash that a photo was downloaded, as its API guidelines require."""
+    try:
+        _get_session().get(download_location, headers=_PROVIDER_CONFIGS['unsplash']['headers'], timeout=10).close()
+    except requests.RequestException as e:
+        logger.warning("Failed to track Unsplash download: %s", e)
 
 
-def _unsplash_post(resp: requests.Response, params: dict) -> tuple[bytes, str]:
-    """Extract the photo URL from Unsplash JSON and fetch its bytes."""
-    photo_url = resp.json()['urls']['full']
-    img_resp = requests.get(photo_url, timeout=10)
-    img_resp.raise_for_status()
-    return img_resp.content, img_resp.headers.get("Content-Type", "image/jpeg")
+def _unsplash_post(resp: requests.Response, params: Mapping,
+                   stream: bool = False) -> tuple[bytes | bytearray | Iterator[bytes], str]:
+    """Extract the photo URL from Unsplash JSON and fetch its bytes.
+
+    The ``raw`` URL is requested with imgix sizing params so the CDN returns an
+    image already cropped to the requested size, and download tracking is sent
+    in the background so it stays off the request path.
+    """
+    photo = resp.json()
+    download_location = photo.get('links', {}).get('download_location')
+    if download_location:
+        _background.submit(_track_unsplash_download, download_location)
+
+    img_params = {
+        'w': params.get('width', 1920),
+        'h': params.get('height', 1080),
+        'fit': 'crop',
+        'fm': 'jpg'
+    }
+    img_resp = _get_session().get(photo['urls']['raw'], params=img_params, timeout=10, stream=True)
+    _raise_for_status(img_resp)
+    return _response_body(img_resp, stream)
 
 
 # ---- Lorem Picsum ----
-def _lorem_picsum_pre(url: str, params: dict) -> tuple[str, dict]:
+# Params that affect the Picsum URL; any other keys are ignored when building it
+_PICSUM_KEYS = frozenset({"w", "h", "webp", "grayscale", "blur"})
+
+
+@functools.lru_cache(maxsize=None)
+def _picsum_builder(keys: frozenset) -> Callable[[Mapping], tuple[str, dict]]:
+    """Return a Picsum URL builder specialized for a set of param keys.
+
+    The presence checks are resolved once per key set here, so the returned
+    builder only reads values. ``keys`` must be a subset of ``_PICSUM_KEYS``,
+    which bounds the number of cached builders.
+    """
+    ext = ".webp" if "webp" in keys else ""
+    static_query = {"grayscale": ""} if "grayscale" in keys else {}  # ?grayscale
+
+    if "blur" in keys:
+        def build(params: Mapping) -> tuple[str, dict]:
+            return (f"https://picsum.photos/{params.get('w', 1920)}/{params.get('h', 1080)}{ext}",
+                    {**static_query, "blur": params["blur"] or ""})  # ?blur  or ?blur=3
+    else:
+        def build(params: Mapping) -> tuple[str, dict]:
+            return (f"https://picsum.photos/{params.get('w', 1920)}/{params.get('h', 1080)}{ext}",
+                    dict(static_query))
+    return build
+
+
+def _lorem_picsum_pre(url: str, params: Mapping) -> tuple[str, dict]:
     """
     Build Picsum URL path and a brand-new query-params dict.
 
@@ -115,121 +329,217 @@ def _lorem_picsum_pre(url: str, params: dict) -> tuple[str, dict]:
     - blur -> presence or numeric value added to query ('' if no value)
     - NO other keys from the input params are copied into the output
     """
-    # read-only access to the input
-    w = params.get("w", 1920)
-    h = params.get("h", 1080)
-    ext = ".webp" if "webp" in params else ""
-    grayscale_present = "grayscale" in params
-    blur_present = "blur" in params
-    blur_val = params.get("blur")  # may be '', '3', or None
-
-    final_url = f"https://picsum.photos/{w}/{h}{ext}"
-
-    # build a brand-new output dict — do NOT reuse or re-insert unrelated input keys
-    query_params: dict = {}
-    if grayscale_present:
-        query_params["grayscale"] = ""           # ?grayscale
-    if blur_present:
-        query_params["blur"] = blur_val or ""    # ?blur  or ?blur=3
+    final_url, query_params = _picsum_builder(_PICSUM_KEYS.intersection(params))(params)
 
     logger.info("Picsum URL: %s  params: %s", final_url, query_params)
     return final_url, query_params
 
 
-def _lorem_picsum_post(resp: requests.Response, params: dict) -> tuple[bytes, str]:
-    """No-op post-processing for Picsum."""
-    return resp.content, resp.headers.get("Content-Type", "image/jpeg")
+# Provider configs are static for the lifetime of the process, so build them once
+_PROVIDER_CONFIGS = _get_provider_configs()
+
 
+def _fetch_from_provider(provider_cfg: dict, params: Mapping,
+                         stream: bool = False) -> tuple[bytes | bytearray | Iterator[bytes], str]:
+    """Fetch a photo from any provider using pre- and post-processing hooks.
 
-def _fetch_from_provider(provider_cfg: dict, params: dict) -> tuple[bytes, str]:
-    """Fetch a photo from any provider using pre- and post-processing hooks."""
-    pre_fn = provider_cfg.get("pre", lambda url, p: (url, p))
-    post_fn = provider_cfg.get("post", lambda resp, _: (resp.content, resp.headers.get("Content-Type", "image/jpeg")))
+    When ``stream`` is True the photo is returned as an iterator of chunks
+    instead of being buffered into memory.
+
+    ``params`` is handed to the ``pre`` hook as-is, so hooks must not mutate it.
+    A hook set to None is skipped: no ``pre`` leaves the URL and params as they
+    are, and no ``post`` returns the response body directly.
+    """
+    pre_fn = provider_cfg.get("pre")
+    post_fn = provider_cfg.get("post")
 
     # Pre-processing
-    url, processed_params = pre_fn(provider_cfg["api_url"], params.copy())
+    if pre_fn is None:
+        url, processed_params = provider_cfg["api_url"], params
+    else:
+        url, processed_params = pre_fn(provider_cfg["api_url"], params)
 
     # Request
-    resp = requests.get(url, headers=provider_cfg.get("headers"), params=processed_params, timeout=10)
-    resp.raise_for_status()
+    resp = _get_session().get(url, headers=provider_cfg.get("headers"), params=processed_params,
+                              timeout=10, stream=True)
+    _raise_for_status(resp)
 
     # Post-processing
-    return post_fn(resp, processed_params)
+    if post_fn is None:
+        return _response_body(resp, stream)
+    return post_fn(resp, processed_params, stream)
+
+
+def _make_key(provider: str, overrides: Mapping[str, str]) -> CacheKey:
+    """Build the cache key for a provider and its query parameter overrides.
+
+    Overrides are stored as a sorted tuple of pairs, which is cheaper to build
+    and hash than a frozenset for the handful of query params a request carries.
+    Override keys are unique, so sorting only ever compares keys; they must be
+    mutually comparable, which holds because query parameter names are strings.
+    """
+    return provider, tuple(sorted(overrides.items()))
 
 
-def _get_from_cache(provider: str, overrides: dict) -> tuple[bytes, str] | None:
+def _get_from_cache(cache_key: CacheKey) -> CacheEntry | None:
     """Retrieve a cached photo if available.
 
     Args:
-        provider (str): Provider key (e.g., 'unsplash', 'lorem_picsum').
-        overrides (dict): Query parameter overrides used as cache key.
+        cache_key (CacheKey): Key built by ``_make_key``.
 
     Returns:
-        tuple[bytes, str] | None: Cached (photo_binary_data, photo_mime_type)
+        CacheEntry | None: Cached (photo_binary_data, photo_mime_type, etag)
             if present, otherwise None.
     """
     if not ENABLE_CACHE:
         logger.debug("_get_from_cache: Cache is disabled.")
         return None
-    cache_key = (provider, frozenset(overrides.items()))
-    logger.debug(f"Searching in cache for: {cache_key} using provider '{provider}', overrides: {overrides}")
-    with cache_lock:
-        return photo_cache.get(cache_key)
-
-
-def _store_in_cache(provider: str, overrides: dict, value: tuple[bytes, str]):
-    """Store a photo result in the cache.
+    logger.debug("Searching in cache for: %s", cache_key)
+    lock, shard = _get_shard(cache_key)
+    # dict reads are atomic under the GIL, so hits don't need to take the lock
+    cached = shard.get(cache_key)
+    # Recency bookkeeping mutates the shard; do it only if the lock is free so
+    # hits never block behind a writer
+    if cached is not None and lock.acquire(blocking=False):
+        try:
+            if cache_key in shard:
+                shard.move_to_end(cache_key)
+        finally:
+            lock.release()
+    return cached
+
+
+def _evict_over_limit(start: int):
+    """Evict entries until the cache holds at most ``CACHE_MAX_ENTRIES``.
+
+    Least recently used entries of the shard at ``start`` (the one just written
+    to) go first, keeping its newest entry; if that is not enough, the following
+    shards are drained oldest-first. Recency is therefore exact within a shard
+    and approximate across shards.
+    """
+    global _cache_size
+    for i in range(CACHE_SHARDS):
+        lock, shard = _shards[(start + i) & (CACHE_SHARDS - 1)]
+        keep = 1 if i == 0 else 0
+        with lock:
+            while len(shard) > keep:
+                with _cache_size_lock:
+                    if _cache_size <= CACHE_MAX_ENTRIES:
+                        return
+                    _cache_size -= 1
+                shard.popitem(last=False)
+
+
+def _store_in_cache(cache_key: CacheKey, value: tuple[bytes | bytearray, str]) -> CacheEntry:
+    """Store a photo result in the cache, evicting entries once the cache holds
+    more than ``CACHE_MAX_ENTRIES`` (see ``_evict_over_limit``).
+
+    An ETag is computed from the photo bytes once here so cache hits can be
+    answered with ``304 Not Modified`` without rehashing.
 
     Args:
-        provider (str): Provider key.
-        overrides (dict): Query parameter overrides used as cache key.
-        value (tuple[bytes, str]): Tuple of (photo_binary_data, photo_mime_type).
+        cache_key (CacheKey): Key built by ``_make_key``.
+        value (tuple[bytes | bytearray, str]): Tuple of (photo_binary_data, photo_mime_type).
+
+    Returns:
+        CacheEntry: The stored (photo_binary_data, photo_mime_type, etag).
     """
+    photo_data, mime_type = value
+    entry = (photo_data, mime_type, hashlib.blake2b(photo_data, digest_size=16).hexdigest())
     if not ENABLE_CACHE:
         logger.debug("_store_in_cache: Cache is disabled.")
-        return
-    cache_key = (provider, frozenset(overrides.items()))
-    logger.debug(f"Storing in cache: {cache_key} using provider '{provider}', overrides: {overrides}")
-    with cache_lock:
-        photo_cache[cache_key] = value
-
-
-def fetch_photo(provider: str, **overrides) -> tuple[bytes, str]:
+        return entry
+    logger.debug("Storing in cache: %s", cache_key)
+    global _cache_size
+    index = _shard_index(cache_key)
+    lock, shard = _shards[index]
+    with lock:
+        is_new = cache_key not in shard
+        shard[cache_key] = entry
+        shard.move_to_end(cache_key)
+        if is_new:
+            with _cache_size_lock:
+                _cache_size += 1
+    if is_new:
+        _evict_over_limit(index)
+    return entry
+
+
+def fetch_photo(provider: str, overrides: Mapping[str, str]) -> tuple[bytes | bytearray | Iterator[bytes], str, str | None]:
     """Fetch a photo from a provider with optional caching.
 
+    With caching disabled the photo is streamed from the provider rather than
+    buffered, so the binary data is an iterator of byte chunks and no ETag is
+    available.
+
     Args:
         provider (str): The photo provider key (e.g., 'unsplash', 'lorem_picsum').
-        **overrides: Arbitrary keyword arguments to override default provider
-            parameters (e.g., theme='nature').
+        overrides (Mapping[str, str]): Values overriding default provider
+            parameters (e.g., {'theme': 'nature'}). The request's query args
+            can be passed directly without copying them into a dict.
 
     Returns:
-        tuple[bytes, str]: (photo_binary_data, photo_mime_type)
+        tuple[bytes | bytearray | Iterator[bytes], str, str | None]:
+            (photo_binary_data, photo_mime_type, etag)
 
     Raises:
         ValueError: If the provider is unknown.
         RuntimeError: If fetching the photo from the provider fails.
     """
-    provider_cfg = _get_provider_configs().get(provider)
-    logger.debug(f"Provider config for '{provider}': {provider_cfg}")
+    provider_cfg = _PROVIDER_CONFIGS.get(provider)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Provider config for '%s': %s", provider, provider_cfg)
     if not provider_cfg:
         raise ValueError(f"Unknown provider: {provider}")
 
-    logger.debug(f"Fetching photo from provider '{provider}' with overrides: {overrides}")
+    logger.debug("Fetching photo from provider '%s' with overrides: %s", provider, overrides)
     params = _build_request_params(provider_cfg, overrides)
 
-    logger.debug(f"Built request params for provider '{provider}': {params}")
-    cached = _get_from_cache(provider, overrides)
+    logger.debug("Built request params for provider '%s': %s", provider, params)
+    cache_key = _make_key(provider, overrides)
+    cached = _get_from_cache(cache_key)
     if cached:
-        logger.info(f"Cache hit for {provider} {overrides}")
+        logger.info("Cache hit for %s %s", provider, overrides)
         return cached
 
     try:
-        logger.info(f"Cache miss for {provider} {overrides}")
-        photo_data, mime_type = _fetch_from_provider(provider_cfg, params)
-        _store_in_cache(provider, overrides, (photo_data, mime_type))
-        return photo_data, mime_type
+        if not ENABLE_CACHE:
+            photo_stream, mime_type = _fetch_from_provider(provider_cfg, params, stream=True)
+            return photo_stream, mime_type, None
+
+        index = _shard_index(cache_key)
+        lock, shard = _shards[index]
+        inflight_shard = _inflight_shards[index]
+        with lock:
+            cached = shard.get(cache_key)
+            inflight = inflight_shard.get(cache_key)
+            is_leader = cached is None and inflight is None
+            if is_leader:
+                inflight = inflight_shard[cache_key] = _InflightFetch()
+        if cached:
+            return cached
+
+        if not is_leader:
+            # The fetching thread always signals ``done``, even on failure, so keep
+            # waiting for as long as it takes rather than failing a slow download
+            logger.debug("Waiting on in-flight fetch for %s", cache_key)
+            while not inflight.done.wait(timeout=INFLIGHT_WAIT_LOG_INTERVAL):
+                logger.info("Still waiting on in-flight fetch for %s %s", provider, overrides)
+            if inflight.entry is None:
+                logger.error("In-flight fetch from provider '%s' failed for %s", provider, overrides)
+                raise RuntimeError(f"Failed to fetch photo from {provider}")
+            return inflight.entry
+
+        logger.info("Cache miss for %s %s", provider, overrides)
+        try:
+            inflight.entry = _store_in_cache(cache_key, _fetch_from_provider(provider_cfg, params))
+            return inflight.entry
+        finally:
+            with lock:
+                inflight_shard.pop(cache_key, None)
+            inflight.done.set()
     except requests.RequestException as e:
-        logger.error(f"Error fetching from provider '{provider}': {e}")
+        logger.error("Error fetching from provider '%s': %s", provider, e)
         raise RuntimeError(f"Failed to fetch photo from {provider}") from e
 
 
@@ -263,28 +573,39 @@ def picture(provider):
 
     HTTP Status Codes:
         200: Successfully retrieved image.
+        304: Client's cached copy (``If-None-Match``) is still current.
         400: Invalid provider requested.
         502: Failed to fetch image from provider.
         500: Unexpected internal error.
     """
-    overrides = request.args.to_dict()
-    logger.info(f"Received request for provider '{provider}' with overrides: {overrides}")
+    overrides = request.args
+    logger.info("Received request for provider '%s' with overrides: %s", provider, overrides)
     try:
         if provider == 'unsplash' and not os.getenv("UNSPLASH_ACCESS_KEY"):
             raise ValueError("Unsplash provider requires UNISPLASH_ACCESS_KEY environment variable.")
-        photo_data, mime_type = fetch_photo(provider, **overrides)
-        return Response(photo_data, mimetype=mime_type)
+        photo_data, mime_type, etag = fetch_photo(provider, overrides)
+        if etag is None:
+            # Uncached photos are random per request, so leave them uncacheable downstream
+            return Response(photo_data, mimetype=mime_type, direct_passthrough=True)
+
+        resp = Response(photo_data, mimetype=mime_type)
+        resp.set_etag(etag)
+        resp.cache_control.public = True
+        resp.cache_control.max_age = CACHE_CONTROL_MAX_AGE
+        # Turns into a bodiless 304 when the client's If-None-Match matches
+        return resp.make_conditional(request)
     except ValueError as ve:
-        logger.warning(f"Invalid provider requested: {ve}")
+        logger.warning("Invalid provider requested: %s", ve)
         return jsonify({"error": str(ve)}), 400
     except RuntimeError as re:
-        logger.error(f"Failed to fetch photo: {re}")
+        logger.error("Failed to fetch photo: %s", re)
         return jsonify({"error": str(re)}), 502
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 
 # --- Run Flask app ---
-if __name__ == "__main__":
-    app.run(debug=True, host='127.0.0.1', port=7078)
+# In production, serve the app with gunicorn using gunicorn.conf.py:
+#   gunicorn -c gunicorn.conf.py server:app
+# For local development, use `flask run` (see README).